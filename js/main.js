@@ -9,18 +9,33 @@ window.translations = {
 
 let currentLang = "lt";
 
-function t(key, vars = {}) {
+function t(key, vars) {
   const dict = window.translations[currentLang] || {};
-  let template = dict[key] || key;
+  const template = dict[key] || key;
+  if (!vars) return template;
+
+  let result = template;
   Object.keys(vars).forEach(k => {
-    template = template.replace(`{${k}}`, vars[k]);
+    result = result.replace(`{${k}}`, vars[k]);
   });
-  return template;
+  return result;
+}
+
+// Messages used per table row on the render path, resolved once per
+// language switch instead of through t() per value.
+const cachedMsgs = { fundNotExist: "", noData: "" };
+
+function refreshMsgCache() {
+  cachedMsgs.fundNotExist = t("msg.fund_not_exist");
+  cachedMsgs.noData = t("msg.no_data_reported");
 }
 
+refreshMsgCache();
+
 function applyLanguage(lang) {
   currentLang = lang;
   document.documentElement.lang = lang;
+  refreshMsgCache();
 
   // Text: data-i18n="key"
   document.querySelectorAll("[data-i18n]").forEach(el => {
@@ -49,7 +64,8 @@ function applyLanguage(lang) {
     btnEN.classList.toggle("active", lang === "en");
   }
 
-  updatePeriodButtons();
+  // Period button state doesn't depend on language, so only re-render the
+  // (cached) tables and refresh popover content here
   renderTables();
   initPopovers(); // IMPORTANT: reinit popovers after updating data-content
 }
@@ -59,22 +75,136 @@ function applyLanguage(lang) {
 // ------------------------
 
 let rawData = [];
+let dataVersion = 0; // bumped on every data (re)load; keys the row cache
 let fundTypes = [];
 let allManagers = [];
 let selectedFundType = null;
 let selectedManager = null;
 
+// Per-(fund_type, company) series sorted by report_date, built once per data
+// load so renders don't rescan rawData. statsCache memoizes the derived
+// per-period aggregates; both are rebuilt only when the data reloads.
+let precomp = new Map();   // packed (ft, company) code -> { dates, rel, participants, bik }
+let statsCache = new Map(); // "code|period" -> stats object or null
+let ftCodes = new Map();   // fund_type -> small int code
+let mgrCodes = new Map();  // company_short -> small int code
+
+const PART_MISSING = -1; // sentinel for absent participant counts in Int32 buffers
+
+// Year-count periods offered by the UI; a lookup replaces regex + parseInt
+const PERIOD_YEARS = { "1": 1, "2": 2, "3": 3, "4": 4, "5": 5 };
+
+// Fund types and companies are low-cardinality, so tokenize them once and
+// pack the pair into one integer instead of concatenating strings per lookup.
+function groupKey(ft, company) {
+  const a = ftCodes.get(ft);
+  const b = mgrCodes.get(company);
+  if (a === undefined || b === undefined) return -1;
+  return (a << 8) | b;
+}
+let byFundType = new Map(); // ft -> { rows, companies, dates, minDateMs, maxDateMs }
+let globalMinMs = null;     // extent of report_date over the whole dataset
+let globalMaxMs = null;
+
+function buildPrecomp() {
+  precomp = new Map();
+  statsCache = new Map();
+  fundPeriodCache = new Map();
+  tableRowsCache = new Map();
+
+  byFundType = new Map();
+  ftCodes = new Map();
+  mgrCodes = new Map();
+
+  const rowsByGroup = new Map();
+  rawData.forEach(row => {
+    let a = ftCodes.get(row.fund_type);
+    if (a === undefined) {
+      a = ftCodes.size;
+      ftCodes.set(row.fund_type, a);
+    }
+    let b = mgrCodes.get(row.company_short);
+    if (b === undefined) {
+      b = mgrCodes.size;
+      mgrCodes.set(row.company_short, b);
+    }
+
+    const key = (a << 8) | b;
+    let rows = rowsByGroup.get(key);
+    if (!rows) {
+      rows = [];
+      rowsByGroup.set(key, rows);
+    }
+    rows.push(row);
+
+    let entry = byFundType.get(row.fund_type);
+    if (!entry) {
+      entry = { rows: [], companies: [], minDateMs: Infinity, maxDateMs: -Infinity };
+      byFundType.set(row.fund_type, entry);
+    }
+    entry.rows.push(row);
+    const ms = row.report_date.getTime();
+    if (ms < entry.minDateMs) entry.minDateMs = ms;
+    if (ms > entry.maxDateMs) entry.maxDateMs = ms;
+  });
+
+  globalMinMs = null;
+  globalMaxMs = null;
+  byFundType.forEach(entry => {
+    entry.companies = Array.from(new Set(entry.rows.map(r => r.company_short))).sort();
+    entry.dates = Array.from(new Set(entry.rows.map(r => r.report_date.getTime())))
+      .sort((a, b) => a - b);
+    if (globalMinMs === null || entry.minDateMs < globalMinMs) globalMinMs = entry.minDateMs;
+    if (globalMaxMs === null || entry.maxDateMs > globalMaxMs) globalMaxMs = entry.maxDateMs;
+  });
+
+  rowsByGroup.forEach((rows, key) => {
+    rows.sort((a, b) => a.report_date - b.report_date);
+
+    // contiguous numeric buffers; float32/int32 are plenty for two- and
+    // three-decimal percentages and participant counts. Missing floats
+    // become NaN; missing counts use PART_MISSING (counts are never
+    // negative). Dates stay float64 — epoch ms overflows int32.
+    const n = rows.length;
+    const dates = new Float64Array(n);
+    const rel = new Float32Array(n);
+    const participants = new Int32Array(n);
+    const bik = new Float32Array(n);
+    rows.forEach((r, i) => {
+      dates[i] = r.report_date.getTime();
+      rel[i] = r.relative_change != null ? r.relative_change : NaN;
+      participants[i] = r.number_of_participants != null ? r.number_of_participants : PART_MISSING;
+      bik[i] = r.bik_pct != null ? r.bik_pct : NaN;
+    });
+
+    precomp.set(key, {
+      dates,
+      rel,
+      participants,
+      bik,
+      // coverage in years over the group's whole available history
+      coverageYears: (dates[n - 1] - dates[0]) / (1000 * 60 * 60 * 24 * 365.25)
+    });
+  });
+}
+
+// Project only the columns the dashboard uses, with explicit types and the
+// date parsed up front — no spread copy of every JSON field per row.
 function parseData(rows) {
-  return rows.map(r => ({
-    ...r,
-    report_date: new Date(r.report_date),
-    fund_type: r.fund_type,
-    company_short: r.company_short,
-    relative_change: r.relative_change != null ? Number(r.relative_change) : null,
-    number_of_participants:
-      r.number_of_participants != null ? Number(r.number_of_participants) : null,
-    bik_pct: r.bik_pct != null ? Number(r.bik_pct) : null
-  }));
+  const out = new Array(rows.length);
+  for (let i = 0; i < rows.length; i++) {
+    const r = rows[i];
+    out[i] = {
+      report_date: new Date(r.report_date),
+      fund_type: r.fund_type,
+      company_short: r.company_short,
+      relative_change: r.relative_change != null ? Number(r.relative_change) : null,
+      number_of_participants:
+        r.number_of_participants != null ? Number(r.number_of_participants) : null,
+      bik_pct: r.bik_pct != null ? Number(r.bik_pct) : null
+    };
+  }
+  return out;
 }
 
 function loadData() {
@@ -82,6 +212,7 @@ function loadData() {
     .then(res => res.json())
     .then(data => {
       rawData = parseData(data);
+      dataVersion++;
 
       const ftSet = new Set();
       const mgrSet = new Set();
@@ -93,6 +224,8 @@ function loadData() {
       fundTypes = Array.from(ftSet).sort();
       allManagers = Array.from(mgrSet).sort();
 
+      buildPrecomp();
+
       // defaults
       selectedFundType = fundTypes.length ? fundTypes[0] : null;
       selectedManager = allManagers.length ? allManagers[0] : null;
@@ -103,68 +236,179 @@ function loadData() {
 // 3. Helpers
 // ------------------------
 
-function getYtdRange(data) {
-  const dates = data.map(r => r.report_date);
-  const end = new Date(Math.max.apply(null, dates));
+function getYtdRange(entry) {
+  const end = new Date(entry.maxDateMs);
   const start = new Date(end.getFullYear(), 0, 1);
   return [start, end];
 }
 
-function getPreviousYearRange(data, months) {
-  const dates = data.map(r => r.report_date);
-  const end = new Date(Math.max.apply(null, dates));
+function getPreviousYearRange(entry, months) {
+  const end = new Date(entry.maxDateMs);
   const base = new Date(end);
   base.setMonth(base.getMonth() - (months - 1));
-  const candidates = data.filter(r => r.report_date > base).map(r => r.report_date);
-  if (!candidates.length) return [null, null];
-  const start = new Date(Math.min.apply(null, candidates));
-  return [start, end];
+  const baseMs = base.getTime();
+
+  // first report date strictly after the cutoff
+  const dates = entry.dates;
+  const i = upperBound(dates, baseMs);
+  if (i === dates.length) return [null, null];
+  return [new Date(dates[i]), end];
 }
 
-function getRange(data, period) {
-  if (!data.length) return [null, null];
+function getRange(entry, period) {
+  if (!entry) return [null, null];
 
-  if (period === "YTD") return getYtdRange(data);
+  if (period === "YTD") return getYtdRange(entry);
   if (period === "ALL") {
-    const allDates = rawData.map(r => r.report_date);
-    const min = new Date(Math.min.apply(null, allDates));
-    const max = new Date(Math.max.apply(null, allDates));
-    return [min, max];
-  }
-  if (/^\d+$/.test(period)) {
-    const years = parseInt(period, 10);
-    return getPreviousYearRange(data, years * 12);
+    // ALL spans the whole dataset, not just the fund type
+    return [new Date(globalMinMs), new Date(globalMaxMs)];
   }
+  const years = PERIOD_YEARS[period];
+  if (years) return getPreviousYearRange(entry, years * 12);
   return [null, null];
 }
 
-function geometricCumulativeGrowth(series) {
-  const clean = series.filter(v => v != null && !Number.isNaN(v));
-  if (!clean.length) return NaN;
-  const results = clean.map(v => v / 100.0);
-  const prod = results.reduce((acc, x) => acc * (1.0 + x), 1.0);
-  return (prod - 1.0) * 100.0;
+// Binary searches over sorted date buffers (np.searchsorted equivalents):
+// first index with arr[i] >= target / arr[i] > target respectively.
+function lowerBound(arr, target) {
+  let lo = 0;
+  let hi = arr.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (arr[mid] < target) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
 }
 
-function annualisedYearlyReturn(series) {
-  const clean = series.filter(v => v != null && !Number.isNaN(v));
-  const quarters = clean.length;
-  if (!quarters) return NaN;
-  const years = quarters / 4.0;
-  if (years <= 0) return NaN;
-
-  const totalGrowthPct = geometricCumulativeGrowth(clean);
-  const totalGrowth = totalGrowthPct / 100.0;
-  const annualised = Math.pow(1.0 + totalGrowth, 1.0 / years) - 1.0;
-  return annualised * 100.0;
+function upperBound(arr, target) {
+  let lo = 0;
+  let hi = arr.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (arr[mid] <= target) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
 }
 
-function fmtSigned(val, decimals = 2, msgIfNaN = t("msg.fund_not_exist")) {
-  if (val === null || Number.isNaN(val)) return msgIfNaN;
-  const factor = Math.pow(10, decimals);
+// Fused kernel: one allocation-free pass over rel[lo, hi) yields the growth
+// factor, quarter count and extremes together. Cumulative and annualised
+// returns are both derived from prod/count by the caller.
+function relWindowStats(rel, lo, hi) {
+  let prod = 1.0;
+  let count = 0;
+  let min = Infinity;
+  let max = -Infinity;
+  for (let i = lo; i < hi; i++) {
+    const v = rel[i];
+    if (Number.isNaN(v)) continue;
+    prod *= 1.0 + v / 100.0;
+    count++;
+    if (v < min) min = v;
+    if (v > max) max = v;
+  }
+  return { prod, count, min, max };
+}
+
+// Period aggregates for one precomputed group. Memoized on
+// (fund_type, company, period) — the [start, end] window is fully determined
+// by those, so it only serves as the slice bounds here.
+function computeStats(ft, company, period, startMs, endMs) {
+  const code = groupKey(ft, company);
+  const cacheKey = code + "|" + period;
+  if (statsCache.has(cacheKey)) return statsCache.get(cacheKey);
+
+  const grp = precomp.get(code);
+  let stats = null;
+
+  if (grp && startMs != null && endMs != null) {
+    // dates are sorted, so the window is one contiguous [lo, hi) span
+    // found by binary search; scalar endpoints are read by index
+    const lo = lowerBound(grp.dates, startMs);
+    const hi = upperBound(grp.dates, endMs);
+
+    if (hi > lo) {
+      const w = relWindowStats(grp.rel, lo, hi);
+      // annualised: quarters / 4 years, so the exponent is 4 / count
+      stats = {
+        growth: w.count ? (w.prod - 1.0) * 100.0 : NaN,
+        avg: w.count ? (Math.pow(w.prod, 4.0 / w.count) - 1.0) * 100.0 : NaN,
+        worst: w.count ? w.min : NaN,
+        best: w.count ? w.max : NaN,
+        firstParticipants: grp.participants[lo] === PART_MISSING ? NaN : grp.participants[lo],
+        lastParticipants: grp.participants[hi - 1] === PART_MISSING ? NaN : grp.participants[hi - 1],
+        lastBik: grp.bik[hi - 1]
+      };
+    }
+  }
+
+  statsCache.set(cacheKey, stats);
+  return stats;
+}
+
+// One pass over a fund type's groups produces every table's inputs at once —
+// the JS analogue of a single groupby.agg — memoized per (fund_type, period).
+// A null stats entry means the company lacks data for the requested range.
+let fundPeriodCache = new Map(); // "ft|period" -> [{ company, stats }]
+
+// Order rows by a parallel numeric key array (the argsort pattern): the
+// comparator touches plain numbers, not row objects.
+function argsortRows(rows, keys, descending) {
+  const idx = new Array(rows.length);
+  for (let i = 0; i < idx.length; i++) idx[i] = i;
+  idx.sort(descending ? (a, b) => keys[b] - keys[a] : (a, b) => keys[a] - keys[b]);
+  return idx.map(i => rows[i]);
+}
+
+function aggregatePeriod(ft, period) {
+  const cacheKey = ft + "|" + period;
+  if (fundPeriodCache.has(cacheKey)) return fundPeriodCache.get(cacheKey);
+
+  const result = [];
+  const entry = byFundType.get(ft);
+
+  if (entry) {
+    const companies = entry.companies;
+
+    // requestedYears: how many full years we require a fund to cover
+    let requestedYears = PERIOD_YEARS[period] || null;
+
+    const [start, end] = getRange(entry, period);
+    const startMs = start ? start.getTime() : null;
+    const endMs = end ? end.getTime() : null;
+
+    if (period === "ALL" && start && end) {
+      const fullDays = (end - start) / (1000 * 60 * 60 * 24);
+      requestedYears = fullDays / 365.25;
+    }
+
+    companies.forEach(c => {
+      const stats = computeStats(ft, c, period, startMs, endMs);
+
+      let hasEnoughHistory = true;
+      if (requestedYears !== null) {
+        const grp = precomp.get(groupKey(ft, c));
+        const covYears = grp ? grp.coverageYears : 0.0;
+        hasEnoughHistory = covYears + 1e-6 >= requestedYears;
+      }
+
+      result.push({ company: c, stats: hasEnoughHistory ? stats : null });
+    });
+  }
+
+  fundPeriodCache.set(cacheKey, result);
+  return result;
+}
+
+const POW10 = [1, 10, 100, 1000];
+
+function fmtSigned(val, decimals = 2, msgIfNaN = cachedMsgs.fundNotExist) {
+  // values come from numeric buffers, so NaN is the only missing marker
+  if (Number.isNaN(val)) return msgIfNaN;
+  const factor = POW10[decimals] || Math.pow(10, decimals);
   const rounded = Math.round(val * factor) / factor;
-  const sign = rounded > 0 ? "+" : "";
-  return `${sign}${rounded.toFixed(decimals)}`;
+  return (rounded > 0 ? "+" : "") + rounded.toFixed(decimals);
 }
 
 function formatDate(d) {
@@ -187,9 +431,18 @@ function getSelectedManager() {
   return selectedManager;
 }
 
+// The period controls are static DOM, so collect them once at startup
+// instead of querying per update
+let periodRadios = [];
+let periodLabels = [];
+
+function cachePeriodControls() {
+  periodRadios = Array.from(document.querySelectorAll('input[name="period"]'));
+  periodLabels = Array.from(document.querySelectorAll("#periodButtons .btn-period"));
+}
+
 function getSelectedPeriod() {
-  const radios = document.querySelectorAll('input[name="period"]');
-  for (const r of radios) {
+  for (const r of periodRadios) {
     if (r.checked) return r.value;
   }
   return "YTD";
@@ -251,26 +504,17 @@ function initFilters() {
 function updatePeriodButtons() {
   const ft = getSelectedFundType();
   const mgr = getSelectedManager();
-  const periodRadios = document.querySelectorAll('input[name="period"]');
-  const periodLabels = document.querySelectorAll("#periodButtons .btn-period");
 
   if (!ft || !rawData.length) return;
 
-  const fundData = rawData.filter(r => r.fund_type === ft);
-  if (!fundData.length) return;
+  const entry = byFundType.get(ft);
+  if (!entry) return;
 
-  let managerData = null;
-  if (mgr) {
-    managerData = fundData.filter(r => r.company_short === mgr);
-  }
-  if (!managerData || !managerData.length) {
-    managerData = fundData;
-  }
-
-  const dates = managerData.map(r => r.report_date);
-  const min = new Date(Math.min.apply(null, dates));
-  const max = new Date(Math.max.apply(null, dates));
-  const spanYears = (max - min) / (1000 * 60 * 60 * 24 * 365.25);
+  // Manager's own history if available, otherwise the whole fund type's
+  const grp = mgr ? precomp.get(groupKey(ft, mgr)) : null;
+  const minMs = grp ? grp.dates[0] : entry.minDateMs;
+  const maxMs = grp ? grp.dates[grp.dates.length - 1] : entry.maxDateMs;
+  const spanYears = (maxMs - minMs) / (1000 * 60 * 60 * 24 * 365.25);
   const maxWholeYears = Math.floor(spanYears);
   const maxButtonYears = Math.min(maxWholeYears, 5);
 
@@ -280,9 +524,9 @@ function updatePeriodButtons() {
   periodRadios.forEach((radio, idx) => {
     const val = radio.value;
     const label = periodLabels[idx];
+    const years = PERIOD_YEARS[val];
 
-    if (/^\d+$/.test(val)) {
-      const years = parseInt(val, 10);
+    if (years) {
       const enabled = years <= maxButtonYears;
       radio.disabled = !enabled;
       label.classList.toggle("disabled", !enabled);
@@ -309,63 +553,41 @@ function updatePeriodButtons() {
 // 5. Tables (with full-range "Veikė anksčiau" logic)
 // ------------------------
 
-function renderTables() {
-  const ft = getSelectedFundType();
-  const period = getSelectedPeriod();
-  const mgr = getSelectedManager();
-
-  const msgFundNotExist = t("msg.fund_not_exist");
-  const msgNoData = t("msg.no_data_reported");
-
-  if (!ft || !period) {
-    ["growthTableBody", "avgTableBody", "extremesTableBody", "participantsTableBody", "bikTableBody"]
-      .forEach(id => {
-        const el = document.getElementById(id);
-        if (el) el.innerHTML = "";
-      });
-    return;
-  }
-
-  const fundData = rawData.filter(r => r.fund_type === ft);
-  if (!fundData.length) return;
-
-  // coverage in years per company (over its whole available history)
-  const coverageYears = {};
-  const companies = Array.from(new Set(fundData.map(r => r.company_short))).sort();
-
-  companies.forEach(c => {
-    const rows = fundData.filter(r => r.company_short === c);
-    const dates = rows.map(r => r.report_date);
-    const min = new Date(Math.min.apply(null, dates));
-    const max = new Date(Math.max.apply(null, dates));
-    const days = (max - min) / (1000 * 60 * 60 * 24);
-    coverageYears[c] = days / 365.25;
-  });
-
-  // requestedYears: how many full years we require a fund to cover
-  let requestedYears = null;
-  if (/^\d+$/.test(period)) {
-    requestedYears = parseInt(period, 10);
-  }
-
-  let baseData;
-  if (period === "ALL") {
-    baseData = rawData;   // ignore fund type and manager
-  } else {
-    baseData = fundData;  // normal behavior
+// One static spec per table: tbody id, row list in the cached build and
+// column layout. Header translations live in index.html via data-i18n,
+// so none of this changes at runtime.
+const TABLE_SPECS = [
+  { bodyId: "growthTableBody", rowsKey: "growthRows",
+    columns: ["company_short", "cumulative_growth"] },
+  { bodyId: "avgTableBody", rowsKey: "avgRows",
+    columns: ["company_short", "avg_yearly_return"] },
+  { bodyId: "extremesTableBody", rowsKey: "extremesRows",
+    columns: ["company_short", "worst_quarter", "best_quarter"] },
+  { bodyId: "participantsTableBody", rowsKey: "participantsRows",
+    columns: ["company_short", "participants_latest", "participants_change"] },
+  { bodyId: "bikTableBody", rowsKey: "bikRows",
+    columns: ["company_short", "expense_ratio"] }
+];
+
+// Formatted, sorted display rows per (dataset version, fund_type, period,
+// language). The selected manager is deliberately not part of the key —
+// it only affects row highlighting, never the sorted content. The "no
+// data" messages are baked in here, so rendering itself never has to
+// post-process or re-format a value.
+let tableRowsCache = new Map(); // "version|ft|period|lang" -> five row lists
+
+function buildTableRows(ft, period) {
+  const cacheKey = dataVersion + "|" + ft + "|" + period + "|" + currentLang;
+  if (tableRowsCache.has(cacheKey)) return tableRowsCache.get(cacheKey);
+
+  const aggregated = aggregatePeriod(ft, period);
+  if (!aggregated.length) {
+    tableRowsCache.set(cacheKey, null);
+    return null;
   }
 
-  const [start, end] = getRange(baseData, period);
-  const rangeData = fundData.filter(
-    r => r.report_date >= start && r.report_date <= end
-  );
-
-  // For ALL, require full coverage of the ALL-range
-  if (period === "ALL" && start && end) {
-    const fullDays = (end - start) / (1000 * 60 * 60 * 24);
-    const fullYears = fullDays / 365.25;
-    requestedYears = fullYears;
-  }
+  const msgFundNotExist = cachedMsgs.fundNotExist;
+  const msgNoData = cachedMsgs.noData;
 
   const growthNumeric = [];
   const growthNoData = [];
@@ -378,159 +600,153 @@ function renderTables() {
   const bikNumeric = [];
   const bikNoData = [];
 
-  companies.forEach(c => {
-    const grpRange = rangeData.filter(r => r.company_short === c);
-    const covYears = coverageYears[c] || 0.0;
-
-    let hasEnoughHistory = true;
-    if (requestedYears !== null) {
-      hasEnoughHistory = covYears + 1e-6 >= requestedYears;
-    }
-
-    if (!grpRange.length || !hasEnoughHistory) {
-      // Fund does not cover the entire requested range
-      growthNoData.push({ company_short: c, cumulative_growth: msgFundNotExist });
-      avgNoData.push({ company_short: c, avg_yearly_return: msgFundNotExist });
-      extremesNoData.push({
-        company_short: c,
-        worst_quarter: msgFundNotExist,
-        best_quarter: msgFundNotExist
-      });
-      participantsNoData.push({
-        company_short: c,
-        participants_latest: msgFundNotExist,
-        participants_change: msgFundNotExist
-      });
-      bikNoData.push({ company_short: c, expense_ratio: msgFundNotExist });
-      return;
-    }
-
-    const sorted = grpRange.slice().sort((a, b) => a.report_date - b.report_date);
-    const relChanges = sorted.map(r => r.relative_change);
+  // sort keys parallel to the numeric row lists (argsort-style ordering,
+  // so rows never carry a throwaway _sort field)
+  const growthKeys = [];
+  const avgKeys = [];
+  const extremesKeys = [];
+  const participantsKeys = [];
+  const bikKeys = [];
+
+  // Partition once on the data mask, then each list is processed
+  // without per-row branching
+  const withData = aggregated.filter(r => r.stats);
+  const withoutData = aggregated.filter(r => !r.stats);
+
+  withoutData.forEach(({ company: c }) => {
+    // Fund does not cover the entire requested range
+    growthNoData.push({ company_short: c, cumulative_growth: msgFundNotExist });
+    avgNoData.push({ company_short: c, avg_yearly_return: msgFundNotExist });
+    extremesNoData.push({
+      company_short: c,
+      worst_quarter: msgFundNotExist,
+      best_quarter: msgFundNotExist
+    });
+    participantsNoData.push({
+      company_short: c,
+      participants_latest: msgFundNotExist,
+      participants_change: msgFundNotExist
+    });
+    bikNoData.push({ company_short: c, expense_ratio: msgFundNotExist });
+  });
 
-    const growthVal = geometricCumulativeGrowth(relChanges);
-    const avgVal = annualisedYearlyReturn(relChanges);
+  withData.forEach(({ company: c, stats }) => {
+    const growthVal = stats.growth;
+    const avgVal = stats.avg;
 
-    const worstVal = Math.min.apply(null, relChanges);
-    const bestVal = Math.max.apply(null, relChanges);
+    const worstVal = stats.worst;
+    const bestVal = stats.best;
 
-    const firstPart = sorted[0].number_of_participants;
-    const lastPart = sorted[sorted.length - 1].number_of_participants;
-    let partLatestStr, partChangeStr, sortPart;
+    // Validity masks first, then straight-line selects (np.where style)
+    const firstPart = stats.firstParticipants;
+    const lastPart = stats.lastParticipants;
+    const partValid = !Number.isNaN(firstPart) && !Number.isNaN(lastPart);
 
-    if (
-      firstPart == null || lastPart == null ||
-      Number.isNaN(firstPart) || Number.isNaN(lastPart)
-    ) {
-      partLatestStr = msgFundNotExist;
-      partChangeStr = msgFundNotExist;
-      sortPart = -Infinity;
-    } else {
-      const latest = Math.round(lastPart);
-      const diff = Math.round(lastPart - firstPart);
-      partLatestStr = String(latest);
-      partChangeStr = diff >= 0 ? `+${diff}` : String(diff);
-      sortPart = latest;
-    }
+    const latest = partValid ? Math.round(lastPart) : 0;
+    const diff = partValid ? Math.round(lastPart - firstPart) : 0;
+    const partLatestStr = partValid ? String(latest) : msgFundNotExist;
+    const partChangeStr = partValid
+      ? (diff >= 0 ? `+${diff}` : String(diff))
+      : msgFundNotExist;
+    const sortPart = partValid ? latest : -Infinity;
 
-    const lastBik = sorted[sorted.length - 1].bik_pct;
-    let bikStr, sortBik;
-    if (lastBik == null || Number.isNaN(lastBik)) {
-      bikStr = msgNoData;
-      sortBik = Infinity;       // sort missing values last
-    } else {
-      bikStr = lastBik.toFixed(3);
-      sortBik = lastBik;
-    }
+    const lastBik = stats.lastBik;
+    const bikValid = !Number.isNaN(lastBik);
+    const bikStr = bikValid ? lastBik.toFixed(3) : msgNoData;
+    const sortBik = bikValid ? lastBik : Infinity; // sort missing values last
 
     growthNumeric.push({
       company_short: c,
-      cumulative_growth: fmtSigned(growthVal, 2, msgFundNotExist),
-      _sort: growthVal
+      cumulative_growth: fmtSigned(growthVal, 2, msgFundNotExist)
     });
+    growthKeys.push(growthVal);
     avgNumeric.push({
       company_short: c,
-      avg_yearly_return: fmtSigned(avgVal, 2, msgFundNotExist),
-      _sort: avgVal
+      avg_yearly_return: fmtSigned(avgVal, 2, msgFundNotExist)
     });
+    avgKeys.push(avgVal);
     extremesNumeric.push({
       company_short: c,
       worst_quarter: fmtSigned(worstVal, 2, msgFundNotExist),
-      best_quarter: fmtSigned(bestVal, 2, msgFundNotExist),
-      _sort: worstVal
+      best_quarter: fmtSigned(bestVal, 2, msgFundNotExist)
     });
+    extremesKeys.push(worstVal);
     participantsNumeric.push({
       company_short: c,
       participants_latest: partLatestStr,
-      participants_change: partChangeStr,
-      _sort: sortPart
+      participants_change: partChangeStr
     });
+    participantsKeys.push(sortPart);
     bikNumeric.push({
       company_short: c,
-      expense_ratio: bikStr,
-      _sort: sortBik
+      expense_ratio: bikStr
     });
+    bikKeys.push(sortBik);
   });
 
-  growthNumeric.sort((a, b) => b._sort - a._sort);
-  avgNumeric.sort((a, b) => b._sort - a._sort);
-  extremesNumeric.sort((a, b) => a._sort - b._sort);
-  participantsNumeric.sort((a, b) => b._sort - a._sort);
-  bikNumeric.sort((a, b) => a._sort - b._sort);
-
-  [growthNumeric, avgNumeric, extremesNumeric, participantsNumeric, bikNumeric]
-    .forEach(list => list.forEach(r => delete r._sort));
-
-  const growthRows = growthNumeric.concat(growthNoData);
-  const avgRows = avgNumeric.concat(avgNoData);
-  const extremesRows = extremesNumeric.concat(extremesNoData);
-  const participantsRows = participantsNumeric.concat(participantsNoData);
-  const bikRows = bikNumeric.concat(bikNoData);
-
-  renderTable("growthTableBody", growthRows, ["company_short", "cumulative_growth"], mgr);
-  renderTable("avgTableBody", avgRows, ["company_short", "avg_yearly_return"], mgr);
-  renderTable("extremesTableBody", extremesRows, ["company_short", "worst_quarter", "best_quarter"], mgr);
-  renderTable(
-    "participantsTableBody",
-    participantsRows,
-    ["company_short", "participants_latest", "participants_change"],
-    mgr
-  );
-  renderTable("bikTableBody", bikRows, ["company_short", "expense_ratio"], mgr);
+  const tables = {
+    growthRows: argsortRows(growthNumeric, growthKeys, true).concat(growthNoData),
+    avgRows: argsortRows(avgNumeric, avgKeys, true).concat(avgNoData),
+    extremesRows: argsortRows(extremesNumeric, extremesKeys, false).concat(extremesNoData),
+    participantsRows: argsortRows(participantsNumeric, participantsKeys, true).concat(participantsNoData),
+    bikRows: argsortRows(bikNumeric, bikKeys, false).concat(bikNoData)
+  };
+  tableRowsCache.set(cacheKey, tables);
+  return tables;
+}
+
+function renderTables() {
+  const ft = getSelectedFundType();
+  const period = getSelectedPeriod();
+  const mgr = getSelectedManager();
+
+  if (!ft || !period) {
+    TABLE_SPECS.forEach(spec => {
+      const el = document.getElementById(spec.bodyId);
+      if (el) el.innerHTML = "";
+    });
+    return;
+  }
+
+  const tables = buildTableRows(ft, period);
+  if (!tables) return;
+
+  TABLE_SPECS.forEach(spec => {
+    renderTable(spec.bodyId, tables[spec.rowsKey], spec.columns, mgr);
+  });
 }
 
+// Columns whose values get sign colouring; the classes live in index.html
+const SIGNED_COLUMNS = new Set([
+  "cumulative_growth", "avg_yearly_return", "worst_quarter", "best_quarter", "participants_change"
+]);
+
+// Cell values are our own formatted numbers, company codes and translated
+// messages, so they can go straight into markup.
 function renderTable(tbodyId, rows, columns, selectedManager) {
   const tbody = document.getElementById(tbodyId);
   if (!tbody) return;
-  tbody.innerHTML = "";
 
-  rows.forEach(row => {
-    const tr = document.createElement("tr");
-    if (row.company_short === selectedManager) {
-      tr.style.backgroundColor = "#fff3cd";
-      tr.style.fontWeight = "700";
-    }
+  let html = "";
+  for (let i = 0; i < rows.length; i++) {
+    const row = rows[i];
+    html += row.company_short === selectedManager ? '<tr class="row-selected">' : "<tr>";
 
-    columns.forEach(col => {
-      const td = document.createElement("td");
+    for (let j = 0; j < columns.length; j++) {
+      const col = columns[j];
       const value = row[col];
-      td.textContent = value;
-
-      if (["cumulative_growth", "avg_yearly_return", "worst_quarter", "best_quarter", "participants_change"].includes(col)) {
-        const v = String(value || "");
-        if (v.includes("+")) {
-          td.style.color = "#2e7d32";
-          td.style.fontWeight = "600";
-        } else if (v.includes("-")) {
-          td.style.color = "#c62828";
-          td.style.fontWeight = "600";
-        }
+      let cls = "";
+      if (SIGNED_COLUMNS.has(col)) {
+        // upstream always produces a formatted string here, never NaN —
+        // placeholder messages simply carry no sign
+        if (value.includes("+")) cls = ' class="val-positive"';
+        else if (value.includes("-")) cls = ' class="val-negative"';
       }
-      tr.appendChild(td);
-    });
-
-    tbody.appendChild(tr);
-  });
+      html += `<td${cls}>${value}</td>`;
+    }
+    html += "</tr>";
+  }
+  tbody.innerHTML = html;
 }
 
 // ------------------------
@@ -582,6 +798,8 @@ function initPopovers() {
 // ------------------------
 
 document.addEventListener("DOMContentLoaded", () => {
+  cachePeriodControls();
+
   const btnLT = document.getElementById("btnLangLT");
   const btnEN = document.getElementById("btnLangEN");
   if (btnLT) btnLT.addEventListener("click", () => applyLanguage("lt"));
@@ -595,7 +813,7 @@ document.addEventListener("DOMContentLoaded", () => {
       const radio = label.querySelector('input[type="radio"]');
       if (!radio || radio.disabled) return;
 
-      document.querySelectorAll(".btn-period").forEach(l => l.classList.remove("active"));
+      periodLabels.forEach(l => l.classList.remove("active"));
       label.classList.add("active");
       radio.checked = true;
 
@@ -1,6 +1,10 @@
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import pandas as pd
+from openpyxl import load_workbook
 
 
 def enforce_types(financial_data: pd.DataFrame) -> pd.DataFrame:
@@ -10,20 +14,26 @@ def enforce_types(financial_data: pd.DataFrame) -> pd.DataFrame:
 
 
 def extract_type_from_fund_code(fund_codes: pd.Series) -> pd.Series:
-    return fund_codes.str.split("-").str[-1].map(SUFFIX_TO_RANGE)
+    # Fund codes repeat every quarter, so split and map once per unique code
+    # and broadcast the result through the categorical codes
+    codes = fund_codes.astype("category")
+    suffixes = codes.cat.categories.str.split("-").str[-1]
+    mapped = np.asarray(suffixes.map(SUFFIX_TO_RANGE))
+    return pd.Series(mapped[codes.cat.codes.to_numpy()], index=fund_codes.index)
 
 
-def fund_code_to_fund_owner(fund_code: str) -> str | None:
-    prefix = fund_code.split("-")[0]
-    return FUND_OWNERS.get(prefix, None)
+def extract_owner_from_fund_code(fund_codes: pd.Series) -> pd.Series:
+    return fund_codes.str.split("-").str[0].map(FUND_OWNERS)
 
 
 def clean_percent_column(df, column):
+    # Arrow-backed strings keep the replace/extract in native kernels and
+    # leave missing values missing instead of stringifying them
     df[column] = (
         df[column]
-        .astype(str)
+        .astype("string[pyarrow]")
         .str.replace(",", ".", regex=False)
-        .str.extract(r"(\d+\.?\d*)")[0]
+        .str.extract(PERCENT_RE)[0]
         .astype(float)
     )
     return df
@@ -36,12 +46,18 @@ def estimate_relative_change(combined_results: pd.DataFrame) -> pd.DataFrame:
     report_dates = combined_results["report_date"]
 
     ytd = combined_results["unit_value_change_ytd_pct"] / 100.0
-    prev_ytd = ytd.groupby(fund_codes).shift(1)
-    prev_date = report_dates.groupby(fund_codes).shift(1)
+
+    # Sorted by (fund_code, report_date), so a plain shift with a fund-code
+    # boundary mask replaces the per-group shifts
+    prev_ytd = ytd.shift(1)
+    prev_date = report_dates.shift(1)
+    same_fund = fund_codes.eq(fund_codes.shift(1))
 
     # Keep first record of the year as that is valid without calculations
-    mask_new_year = prev_date.isna() | (
-        combined_results["report_date"].dt.year != prev_date.dt.year
+    mask_new_year = (
+        ~same_fund
+        | prev_date.isna()
+        | (report_dates.dt.year != prev_date.dt.year)
     )
 
     relative_change = np.where(
@@ -50,10 +66,43 @@ def estimate_relative_change(combined_results: pd.DataFrame) -> pd.DataFrame:
         (1 + ytd) / (1 + prev_ytd) - 1,
     )
 
-    combined_results["relative_change"] = relative_change * 100.0
+    # float32 to match the other percentage columns in COLNAMES_MAPPER
+    combined_results["relative_change"] = (relative_change * 100.0).astype(np.float32)
     return combined_results
 
 
+def read_report(filepath: str) -> pd.DataFrame:
+    # Read-only mode streams cell values and skips styling/formula parsing
+    workbook = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+
+        header = next(rows)
+        report_date = header[0]
+
+        # Two banner rows sit between the header and the fund rows
+        next(rows, None)
+        next(rows, None)
+
+        financial_data = pd.DataFrame(rows)
+    finally:
+        workbook.close()
+
+    # Read-only sheets report their declared width, including trailing
+    # all-empty columns that pd.read_excel would trim; drop them so the
+    # negative indices below still land on the expense-ratio columns
+    filled = np.where(financial_data.notna().any())[0]
+    financial_data = financial_data.iloc[:, : filled[-1] + 1]
+
+    financial_data = financial_data.iloc[:, [0, 1, 2, 6, 8, -2, -1]]
+    financial_data.columns = list(COLNAMES_MAPPER.keys())
+    financial_data["report_date"] = report_date
+    return financial_data
+
+
+# Numeric part of a percent cell, shared by both percent-column cleanups
+PERCENT_RE = re.compile(r"(\d+\.?\d*)")
+
 SUFFIX_TO_RANGE = {
     "03/09": "2003-2009",
     "96/02": "1996-2002",
@@ -76,6 +125,14 @@ COLNAMES_MAPPER = {
     "predicted_bik_pct": "float32",
 }
 
+CATEGORICAL_COLUMNS = [
+    "company_name",
+    "fund_code",
+    "fund_name",
+    "fund_type",
+    "company_short",
+]
+
 FUND_OWNERS = {
     "LMN": "Luminor",
     "INV": "Artea",
@@ -86,56 +143,67 @@ FUND_OWNERS = {
 }
 
 
-combined_results = []
-for root, dirs, files in os.walk("raw_data"):
-    for filename in files:
-        if not filename.lower().endswith((".xlsx")):
-            continue
+def main() -> None:
+    filepaths = []
+    for root, dirs, files in os.walk("raw_data"):
+        for filename in files:
+            if not filename.lower().endswith((".xlsx")):
+                continue
 
-        filepath = os.path.join(root, filename)
-        print(f"Processing: {filepath}")
+            filepath = os.path.join(root, filename)
+            print(f"Processing: {filepath}")
+            filepaths.append(filepath)
 
-        excel_file = pd.read_excel(filepath)
-        report_date = excel_file.columns[0]
+    # Workbooks parse independently, so fan the reads out across processes;
+    # all cleaning still runs once on the combined frame
+    with ProcessPoolExecutor() as executor:
+        combined_results = list(executor.map(read_report, filepaths))
 
-        financial_data = excel_file.iloc[2:].copy()
-        financial_data = financial_data.iloc[:, [0, 1, 2, 6, 8, -2, -1]]
+    if combined_results:
+        combined = pd.concat(combined_results, ignore_index=True)
 
-        financial_data.columns = list(COLNAMES_MAPPER.keys())
+        rows_with_financials = combined["fund_code"].notna()
+        combined = combined[rows_with_financials].reset_index(drop=True)
 
-        rows_with_financials = financial_data["fund_code"].notna()
-        financial_data = financial_data[rows_with_financials].reset_index(drop=True)
+        combined = combined.replace(["Veikia trumpiau", "-"], None)
+        combined = clean_percent_column(combined, "bik_pct")
+        combined = clean_percent_column(combined, "predicted_bik_pct")
 
-        financial_data = financial_data.replace(["Veikia trumpiau", "-"], None)
-        financial_data = clean_percent_column(financial_data, "bik_pct")
-        financial_data = clean_percent_column(financial_data, "predicted_bik_pct")
+        combined = enforce_types(combined)
 
-        financial_data["report_date"] = report_date
-        financial_data = enforce_types(financial_data)
+        fund_codes = combined["fund_code"]
+        combined["fund_type"] = extract_type_from_fund_code(fund_codes)
+        combined["company_short"] = extract_owner_from_fund_code(fund_codes)
 
-        fund_codes = financial_data["fund_code"]
-        financial_data["fund_type"] = extract_type_from_fund_code(fund_codes)
-        financial_data["company_short"] = fund_codes.apply(fund_code_to_fund_owner)
+        # Backfill from the predicted ratio only when something is actually missing
+        if combined["bik_pct"].isna().to_numpy().any():
+            combined["bik_pct"] = combined["bik_pct"].fillna(combined["predicted_bik_pct"])
 
-        financial_data["bik_pct"] = financial_data["bik_pct"].fillna(
-            financial_data["predicted_bik_pct"]
-        )
+        ytd_present = ~np.isnan(combined["unit_value_change_ytd_pct"].to_numpy())
+        combined = combined[ytd_present]
+        combined_results = estimate_relative_change(combined)
 
-        financial_data = financial_data.dropna(subset=["unit_value_change_ytd_pct"])
-        combined_results.append(financial_data)
+        # Low-cardinality string columns become categoricals, so the Parquet
+        # cache is dictionary-encoded and loads with the compact dtypes intact
+        for col_name in CATEGORICAL_COLUMNS:
+            combined_results[col_name] = combined_results[col_name].astype("category")
 
-if combined_results:
-    combined = pd.concat(combined_results, ignore_index=True)
-    combined_results = estimate_relative_change(combined)
+        combined_results.to_csv("combined_results.csv")
 
-    combined_results.to_csv("combined_results.csv")
+        # Columnar cache with dtypes and dates preserved, so downstream
+        # consumers can skip CSV parsing on startup
+        combined_results.to_parquet("combined_results.parquet")
 
-    path = "data/combined_results.json"
-    combined_results.to_json(
-        path,
-        orient="records",
-        date_format="iso",
-    )
-    print(f"Saved combined file: {path}")
-else:
-    print("No Excel files found / processed.")
+        path = "data/combined_results.json"
+        combined_results.to_json(
+            path,
+            orient="records",
+            date_format="iso",
+        )
+        print(f"Saved combined file: {path}")
+    else:
+        print("No Excel files found / processed.")
+
+
+if __name__ == "__main__":
+    main()